@@ -14,6 +14,8 @@ class Settings(BaseSettings):
     APP_NAME: str = "Universal Data Connector"
     MAX_RESULTS: int = 10
     LOG_LEVEL: str = "INFO"
+    WARMUP_ON_STARTUP: bool = True  # load + index connector data before serving requests
+    TOOL_CACHE_TTL: float = 30.0  # seconds an agent tool result is reused; 0 disables
 
     # ── Groq (STT + LLM + TTS — all from one API key) ──
     GROQ_API_KEY: str = ""
@@ -1 +1,8 @@
-# Connectors package
+# Connectors package — process-wide singletons shared by the REST routers and the voice agent
+from app.connectors.crm_connector import CRMConnector
+from app.connectors.support_connector import SupportConnector
+from app.connectors.analytics_connector import AnalyticsConnector
+
+crm = CRMConnector()
+support = SupportConnector()
+analytics = AnalyticsConnector()
@@ -1,11 +1,88 @@
 """Analytics connector — filter by metric name and date range, plus summary aggregation."""
 
-from datetime import datetime, timedelta, timezone
-from statistics import mean
-from typing import Any, Dict, List, Optional
+import time
+from bisect import bisect_left
+from datetime import date
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from app.connectors.base import BaseConnector
 from app.models.common import DataType
+from app.services.numba_kernels import summarize as _summarize_kernel
+
+
+_NUMPY_MIN_POINTS = 64  # below this NumPy's per-call overhead outweighs a Python loop
+_NO_VALUES = np.empty(0)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@lru_cache(maxsize=32)
+def _cutoff_key(days: int, utc_day: int) -> int:
+    """YYYYMMDD int of the date `days` before `utc_day` (days since the Unix epoch, UTC)."""
+    d = date.fromordinal(_EPOCH_ORDINAL + utc_day - days)
+    return d.year * 10000 + d.month * 100 + d.day
+
+
+def _summarize(values: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """(average, min, max, first-half avg, second-half avg) of a non-empty value column."""
+    n = values.size
+    mid = n // 2
+    if n >= _NUMPY_MIN_POINTS and _summarize_kernel is not None and values.dtype in (np.float64, np.int64):
+        return _summarize_kernel(values)
+    if n >= _NUMPY_MIN_POINTS:
+        # .item() keeps integer metrics as Python ints
+        return (
+            float(values.mean()),
+            values.min().item(),
+            values.max().item(),
+            float(values[:mid].mean()),
+            float(values[mid:].mean()),
+        )
+    # small windows: C-level builtins over native numbers, no per-item interpreter branches
+    vals = values.tolist()
+    first_sum = sum(vals[:mid])
+    second_sum = sum(vals[mid:])
+    vmin, vmax = min(vals), max(vals)
+    first_avg = first_sum / mid if mid else 0
+    return (first_sum + second_sum) / n, vmin, vmax, first_avg, second_sum / (n - mid)
+
+
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_analytics",
+            "description": "Retrieve analytics metrics. Filter by metric name and time range (days).",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "metric": {"type": "string", "description": "Metric name, e.g. 'daily_active_users'"},
+                    "days": {"type": "integer", "description": "Days to look back", "default": 7},
+                    "limit": {"type": "integer", "description": "Max data points", "default": 10},
+                },
+                "required": [],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_analytics_summary",
+            "description": "Summarized analytics: average, min, max, trend. Best for voice.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "metric": {"type": "string", "description": "Metric name"},
+                    "days": {"type": "integer", "description": "Days to look back", "default": 7},
+                },
+                "required": [],
+            },
+        },
+    },
+]
 
 
 class AnalyticsConnector(BaseConnector):
@@ -13,76 +90,74 @@ class AnalyticsConnector(BaseConnector):
     source_name = "Analytics"
     data_type = DataType.TIME_SERIES
     _data_file = "analytics.json"
-    _id_field = ""  # no single-record ID
+    _id_field = ""  # no single-record ID, so get_by_id always returns None
     _search_fields = ("metric",)
+    _presorted_by = ("date", "desc")
+
+    def _build_cache(self, data):
+        # Records are held newest-first (a stable sort, so same-date rows keep file order);
+        # `data` is freshly parsed and not yet shared, so sort it in place.
+        data.sort(key=itemgetter("date"), reverse=True)
+        entry = super()._build_cache(data)
+        # metric (None = all) -> (YYYYMMDD ints, records, value column), all oldest-first,
+        # so the day cutoff is a bisect and the match a suffix read back newest-first.
+        oldest_first = entry["data"][::-1]
+        timelines = {None: oldest_first}
+        for r in oldest_first:
+            timelines.setdefault(r["metric"], []).append(r)
+        entry["timelines"] = {
+            k: (
+                [int(r["date"].replace("-", "")) for r in recs],
+                recs,
+                np.array([r["value"] for r in recs]),
+            )
+            for k, recs in timelines.items()
+        }
+        entry["summaries"] = {}  # (metric, window length) -> _summarize() result
+        return entry
 
-    def _apply_filters(self, data, **filters):
-        metric = filters.get("metric")
-        if metric:
-            data = [r for r in data if r["metric"] == metric]
-        days = filters.get("days")
+    def _window(
+        self, metric: Optional[str], days: Optional[int], entry: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """Oldest-first records and values for `metric` (None = all) within the last `days`."""
+        entry = entry or self._cache()
+        dates, records, values = entry["timelines"].get(metric or None, ([], [], _NO_VALUES))
+        start = 0
         if days:
-            cutoff = (datetime.now(timezone.utc) - timedelta(days=int(days))).date().isoformat()
-            data = [r for r in data if r["date"] >= cutoff]
-        return data
+            # keyed on the UTC day, so every call within a day shares one computed cutoff
+            start = bisect_left(dates, _cutoff_key(int(days), int(time.time()) // 86400))
+        return records[start:], values[start:]
 
-    def get_by_id(self, record_id: int):
-        return None  # analytics has no single-record IDs
+    def _apply_filters(self, **filters):
+        records, _ = self._window(filters.get("metric"), filters.get("days"))
+        return records[::-1]
 
     def get_summary(self, *, metric: Optional[str] = None, days: int = 7) -> Dict[str, Any]:
-        items = self.fetch(limit=999, metric=metric, days=days)["items"]
-        if not items:
+        entry = self._cache()
+        records, values = self._window(metric, days, entry)
+        if not records:
             return {"summary": "No data available for the requested period."}
 
-        values = [r["value"] for r in items]
-        mid = len(values) // 2
-        first_avg = mean(values[:mid]) if mid else 0
-        second_avg = mean(values[mid:]) if values[mid:] else 0
+        # a window is a suffix of its timeline, so its length identifies it
+        key = (metric or None, len(records))
+        stats = entry["summaries"].get(key)
+        if stats is None:
+            # newest-first, matching fetch() order; reversing a NumPy slice is a view, not a copy
+            stats = entry["summaries"][key] = _summarize(values[::-1])
+        average, vmin, vmax, first_avg, second_avg = stats
         trend = "up" if second_avg > first_avg else "down" if second_avg < first_avg else "flat"
 
         return {
             "metric": metric or "all",
             "period_days": days,
-            "data_points": len(values),
-            "average": round(mean(values), 1),
-            "min": min(values),
-            "max": max(values),
-            "latest_value": items[0].get("value"),
-            "latest_date": items[0].get("date"),
+            "data_points": len(records),
+            "average": round(average, 1),
+            "min": vmin,
+            "max": vmax,
+            "latest_value": records[-1].get("value"),
+            "latest_date": records[-1].get("date"),
             "trend": trend,
         }
 
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_analytics",
-                    "description": "Retrieve analytics metrics. Filter by metric name and time range (days).",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "metric": {"type": "string", "description": "Metric name, e.g. 'daily_active_users'"},
-                            "days": {"type": "integer", "description": "Days to look back", "default": 7},
-                            "limit": {"type": "integer", "description": "Max data points", "default": 10},
-                        },
-                        "required": [],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_analytics_summary",
-                    "description": "Summarized analytics: average, min, max, trend. Best for voice.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "metric": {"type": "string", "description": "Metric name"},
-                            "days": {"type": "integer", "description": "Days to look back", "default": 7},
-                        },
-                        "required": [],
-                    },
-                },
-            },
-        ]
+        return _TOOL_DEFINITIONS
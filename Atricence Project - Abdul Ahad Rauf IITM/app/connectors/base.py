@@ -1,19 +1,52 @@
 """
 Abstract base class with shared load/sort/paginate logic.
 Subclasses only configure: source_name, data_type, _data_file, _id_field,
-_search_fields, and override _apply_filters / get_tool_definitions.
+_search_fields, _index_fields, _presorted_by, _warm_views, and override
+_apply_filters / get_tool_definitions.
+
+Parsed data files are cached process-wide together with their hash indexes
+and sorted views, and rebuilt only when the file's (mtime_ns, size) stamp
+changes, so every connector method must treat loaded records as read-only.
 """
 
-import json, logging
+import heapq, logging, sys, threading
+from collections import OrderedDict
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 from app.models.common import DataType
+from app.utils.serialization import loads
 
 logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
+# data file name -> ((mtime_ns, size), cache entry); shared by every connector instance
+_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_VIEW_CACHE_SIZE = 8  # sorted views kept per data file (LRU)
+_SEARCH_CACHE_SIZE = 32  # search results kept per data file (LRU)
+_lru_lock = threading.Lock()
+
+
+def _sorted_rows(data: List[Dict[str, Any]], rows, sort_by: str, sort_order: str) -> List[int]:
+    """`rows` ordered by data[row][sort_by]; the key is a C-level dict lookup, not a lambda."""
+    column = {i: data[i].get(sort_by, "") for i in rows}
+    return sorted(rows, key=column.__getitem__, reverse=(sort_order == "desc"))
+
+
+def _first_sorted(data: List[Dict[str, Any]], sort_by: str, reverse: bool, n: int) -> List[Dict[str, Any]]:
+    """The first `n` records of `data` ordered by `sort_by` — heap selection, O(N log n), when n < N."""
+    def select(key):
+        if n < len(data):
+            return (heapq.nlargest if reverse else heapq.nsmallest)(n, data, key=key)
+        return sorted(data, key=key, reverse=reverse)
+
+    try:
+        return select(itemgetter(sort_by))
+    except KeyError:  # some record lacks the field — sort it as ""
+        return select(lambda r: r.get(sort_by, ""))
+
 
 class BaseConnector(ABC):
 
@@ -22,19 +55,124 @@ class BaseConnector(ABC):
     _data_file: str       # e.g. "customers.json"
     _id_field: str         # e.g. "customer_id"
     _search_fields: tuple  # e.g. ("name", "email")
+    _index_fields: tuple = ()  # equality-filter fields, e.g. ("status",)
+    _presorted_by: Optional[tuple] = None  # (sort_by, sort_order) _apply_filters already yields
+    _warm_views: tuple = ()  # (sort_by, sort_order) views built with the cache, e.g. (("created_at", "desc"),)
 
     # ── shared helpers ──────────────────────────────────────────────
+    def _cache(self) -> Dict[str, Any]:
+        """Return the cache entry for the data file, rebuilding it if the file changed."""
+        path = PROJECT_ROOT / "data" / self._data_file
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)  # size catches same-tick rewrites on coarse clocks
+        cached = _CACHE.get(self._data_file)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        entry = self._build_cache(loads(path.read_bytes()))
+        _CACHE[self._data_file] = (stamp, entry)
+        logger.debug("%s loaded %d records from %s", self.source_name, len(entry["data"]), self._data_file)
+        return entry
+
+    def _build_cache(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Index records by id and bucket row positions by each _index_fields value."""
+        by_field: Dict[str, Dict[Any, List[int]]] = {f: {} for f in self._index_fields}
+        for i, r in enumerate(data):
+            for field, buckets in by_field.items():
+                value = r.get(field)
+                if type(value) is str:
+                    # one shared object per category; equality checks against it short-circuit on identity
+                    r[field] = value = sys.intern(value)
+                buckets.setdefault(value, []).append(i)
+        by_id: Dict[Any, Dict[str, Any]] = {}
+        if self._id_field:
+            for r in data:
+                by_id.setdefault(r.get(self._id_field), r)  # first match wins, as a scan would
+        views: Dict[tuple, List[int]] = OrderedDict()
+        for sort_by, sort_order in self._warm_views:
+            views[(sort_by, sort_order, frozenset())] = _sorted_rows(data, range(len(data)), sort_by, sort_order)
+        return {
+            "data": data,
+            "by_id": by_id,
+            "by_field": by_field,
+            # lowercased _search_fields per row; NUL keeps a match inside one field
+            "search_blobs": [
+                "\0".join(str(r.get(f, "")) for f in self._search_fields).lower() for r in data
+            ],
+            "views": views,  # (sort_by, sort_order, filters) -> sorted row positions
+            "searches": OrderedDict(),  # lowercased query -> matching row positions
+        }
+
     def _load(self) -> List[Dict[str, Any]]:
-        with open(PROJECT_ROOT / "data" / self._data_file) as f:
-            return json.load(f)
+        return self._cache()["data"]
 
-    def _apply_filters(
-        self, data: List[Dict[str, Any]], **filters: Any
-    ) -> List[Dict[str, Any]]:
-        """Override in subclasses if filters go beyond simple equality."""
-        return data
+    def _index_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """The equality filters in `filters` that _index_fields can answer (falsy = unset)."""
+        return {f: filters[f] for f in self._index_fields if filters.get(f)}
+
+    def _rows(self, **equals: Any) -> Sequence[int]:
+        """Row positions whose indexed fields equal the given values, in file order (read-only)."""
+        entry = self._cache()
+        data = entry["data"]
+        if not equals:
+            return range(len(data))
+        by_field = entry["by_field"]
+        # Walk the smallest bucket once, checking the other fields with one composed key.
+        field = min(equals, key=lambda f: len(by_field[f].get(equals[f], ())))
+        bucket = by_field[field].get(equals[field], [])
+        rest = [f for f in equals if f != field]
+        if not rest:
+            return bucket
+        key = itemgetter(*rest)
+        wanted = tuple(equals[f] for f in rest) if len(rest) > 1 else equals[rest[0]]
+        return [i for i in bucket if key(data[i]) == wanted]
+
+    def _select(self, **equals: Any) -> List[Dict[str, Any]]:
+        """Records whose indexed fields equal the given values, in file order."""
+        data = self._load()
+        if not equals:
+            return data
+        return [data[i] for i in self._rows(**equals)]
+
+    def _sorted_view(self, sort_by: str, sort_order: str, equals: Dict[str, Any]) -> Sequence[int]:
+        """Row positions matching `equals`, sorted by `sort_by`; memoised per data file."""
+        entry = self._cache()
+        views = entry["views"]
+        key = (sort_by, sort_order, frozenset(equals.items()))
+        with _lru_lock:
+            rows = views.get(key)
+            if rows is not None:
+                views.move_to_end(key)
+                return rows
+            full = views.get((sort_by, sort_order, frozenset())) if equals else None
+        data = entry["data"]
+        rows = self._rows(**equals)
+        if full is not None:
+            # the unfiltered view already orders these rows: filter it instead of sorting
+            members = set(rows)
+            rows = [i for i in full if i in members]
+        elif rows and sort_by in data[rows[0]]:
+            rows = _sorted_rows(data, rows, sort_by, sort_order)
+        with _lru_lock:
+            views[key] = rows
+            if len(views) > _VIEW_CACHE_SIZE:
+                views.popitem(last=False)
+        return rows
+
+    def _apply_filters(self, **filters: Any) -> List[Dict[str, Any]]:
+        """Override in subclasses if filters go beyond indexed equality.
+        Must return a new list (or the cached one untouched) — never mutate it."""
+        return self._select(**self._index_filters(filters))
 
     # ── public API with shared sort/paginate ────────────────────────
+    def warm(self) -> None:
+        """Load and index the data file now rather than on the first request."""
+        self._cache()
+
+    def generation(self) -> tuple:
+        """Stamp of the loaded data file; changes whenever the file does."""
+        self._cache()
+        return _CACHE[self._data_file][0]
+
     def fetch(
         self,
         *,
@@ -44,31 +182,53 @@ class BaseConnector(ABC):
         sort_order: str = "desc",
         **filters: Any,
     ) -> Dict[str, Any]:
-        data = self._apply_filters(self._load(), **filters)
+        start = (page - 1) * limit
+        equals = self._index_filters(filters)
+        presorted = not sort_by or (sort_by, sort_order) == self._presorted_by
 
-        if sort_by and data and sort_by in data[0]:
-            data.sort(key=lambda r: r.get(sort_by, ""), reverse=(sort_order == "desc"))
+        if presorted and not any(filters.values()):
+            # unfiltered, stored order: one C-level slice of the cached list
+            data = self._load()
+            total, items = len(data), data[start : start + limit]
+        elif len(equals) == sum(1 for v in filters.values() if v):
+            # only indexed filters: page through row positions, materialising just the page
+            rows = self._rows(**equals) if presorted else self._sorted_view(sort_by, sort_order, equals)
+            total, rows = len(rows), rows[start : start + limit]
+            data = self._load()
+            items = [data[i] for i in rows]
+        else:
+            data = self._apply_filters(**filters)
+            total = len(data)
+            if not presorted and data and sort_by in data[0]:
+                # only pages up to this one need ordering
+                items = _first_sorted(data, sort_by, sort_order == "desc", start + limit)[start:]
+            else:
+                items = data[start : start + limit]
 
-        total = len(data)
-        start = (page - 1) * limit
-        items = data[start : start + limit]
         logger.info("%s fetch: %d total, page %d (%d items)", self.source_name, total, page, len(items))
         return {"items": items, "total": total}
 
     def search(self, query: str, *, limit: int = 10) -> Dict[str, Any]:
         q = query.lower()
-        hits = [
-            r for r in self._load()
-            if any(q in str(r.get(f, "")).lower() for f in self._search_fields)
-        ]
-        return {"items": hits[:limit], "total": len(hits)}
+        entry = self._cache()
+        searches = entry["searches"]
+        with _lru_lock:
+            rows = searches.get(q)
+            if rows is not None:
+                searches.move_to_end(q)
+        if rows is None:
+            rows = [i for i, blob in enumerate(entry["search_blobs"]) if q in blob]
+            with _lru_lock:
+                searches[q] = rows
+                if len(searches) > _SEARCH_CACHE_SIZE:
+                    searches.popitem(last=False)
+        data = entry["data"]
+        return {"items": [data[i] for i in rows[:limit]], "total": len(rows)}
 
     def get_by_id(self, record_id: int) -> Optional[Dict[str, Any]]:
-        for r in self._load():
-            if r.get(self._id_field) == record_id:
-                return r
-        return None
+        return self._cache()["by_id"].get(record_id)
 
     @abstractmethod
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
+        """OpenAI-style function definitions — a module constant, shared and read-only."""
         ...
@@ -6,6 +6,42 @@ from app.connectors.base import BaseConnector
 from app.models.common import DataType
 
 
+_TOOL_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_support_tickets",
+            "description": "Retrieve support tickets. Filter by priority (high/medium/low), status (open/closed), customer_id.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "priority": {"type": "string", "enum": ["high", "medium", "low"], "description": "Filter by priority"},
+                    "status": {"type": "string", "enum": ["open", "closed"], "description": "Filter by status"},
+                    "customer_id": {"type": "integer", "description": "Filter by customer ID"},
+                    "limit": {"type": "integer", "description": "Results per page", "default": 5},
+                    "page": {"type": "integer", "description": "Page number", "default": 1},
+                },
+                "required": [],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_ticket_by_id",
+            "description": "Get a specific support ticket by ID.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "ticket_id": {"type": "integer", "description": "The ticket ID"},
+                },
+                "required": ["ticket_id"],
+            },
+        },
+    },
+]
+
+
 class SupportConnector(BaseConnector):
 
     source_name = "Support Tickets"
@@ -13,49 +49,14 @@ class SupportConnector(BaseConnector):
     _data_file = "support_tickets.json"
     _id_field = "ticket_id"
     _search_fields = ("subject",)
+    _index_fields = ("priority", "status", "customer_id")
+    _warm_views = (("created_at", "desc"),)
 
-    def _apply_filters(self, data, **filters):
-        if filters.get("priority"):
-            data = [r for r in data if r["priority"] == filters["priority"]]
-        if filters.get("status"):
-            data = [r for r in data if r["status"] == filters["status"]]
-        if filters.get("customer_id"):
-            cid = int(filters["customer_id"])
-            data = [r for r in data if r["customer_id"] == cid]
-        return data
+    def _index_filters(self, filters):
+        equals = super()._index_filters(filters)
+        if "customer_id" in equals:
+            equals["customer_id"] = int(equals["customer_id"])
+        return equals
 
     def get_tool_definitions(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_support_tickets",
-                    "description": "Retrieve support tickets. Filter by priority (high/medium/low), status (open/closed), customer_id.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "priority": {"type": "string", "enum": ["high", "medium", "low"], "description": "Filter by priority"},
-                            "status": {"type": "string", "enum": ["open", "closed"], "description": "Filter by status"},
-                            "customer_id": {"type": "integer", "description": "Filter by customer ID"},
-                            "limit": {"type": "integer", "description": "Results per page", "default": 5},
-                            "page": {"type": "integer", "description": "Page number", "default": 1},
-                        },
-                        "required": [],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_ticket_by_id",
-                    "description": "Get a specific support ticket by ID.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "ticket_id": {"type": "integer", "description": "The ticket ID"},
-                        },
-                        "required": ["ticket_id"],
-                    },
-                },
-            },
-        ]
+        return _TOOL_DEFINITIONS
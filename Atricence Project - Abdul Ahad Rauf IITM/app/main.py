@@ -6,15 +6,29 @@ This is the REST API server. For the voice interface,
 run src/fastrtc_data_stream.py instead.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.connectors import crm, support, analytics
 from app.routers import health, data
 from app.utils.logging import configure_logging
 from app.config import settings
 
 configure_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pay the file parse + index build at startup so the first request is as fast as the rest;
+    # the three files are independent, so their reads overlap on worker threads.
+    if settings.WARMUP_ON_STARTUP:
+        await asyncio.gather(*(asyncio.to_thread(c.warm) for c in (crm, support, analytics)))
+    yield
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     description=(
@@ -24,6 +38,7 @@ app = FastAPI(
         "interface powered by FastRTC and Groq."
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # ── CORS ────────────────────────────────────────────────────────────────
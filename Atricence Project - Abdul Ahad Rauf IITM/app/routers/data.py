@@ -3,34 +3,28 @@ Data router — unified REST API for CRM, Support, and Analytics.
 Uses a single _build_response() helper to eliminate copy-paste handlers.
 """
 
-import math, logging
+import logging
 from typing import Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Response
 
-from app.connectors.crm_connector import CRMConnector
-from app.connectors.support_connector import SupportConnector
-from app.connectors.analytics_connector import AnalyticsConnector
+from app.connectors import crm, support, analytics
 from app.services.business_rules import sort_by_priority, generate_context_string, freshness_label
 from app.services.voice_optimizer import generate_voice_summary, generate_voice_hint
-from app.services.data_identifier import identify_data_type
-from app.models.common import DataResponse, Metadata
+from app.models.common import DataResponse, DataType, Metadata
+from app.utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Data"])
 
-# ── Singleton connector instances ──────────────────────────────────────
-crm = CRMConnector()
-support = SupportConnector()
-analytics = AnalyticsConnector()
-
 
 # ── DRY response builder ──────────────────────────────────────────────
 def _build_response(
     source: str,
     result: dict,
     *,
+    data_type: DataType,
     page: int = 1,
     limit: int = 10,
     context: Optional[str] = None,
@@ -38,16 +32,17 @@ def _build_response(
 ) -> DataResponse:
     items = post_sort(result["items"]) if post_sort else result["items"]
     total = result["total"]
-    total_pages = max(1, math.ceil(total / limit))
+    total_pages = max(1, -(-total // limit))  # integer ceil division
 
-    return DataResponse(
+    # Connector output is trusted, so build the models without re-validating it.
+    return DataResponse.model_construct(
         data=items,
-        metadata=Metadata(
+        metadata=Metadata.model_construct(
             total_results=total,
             returned_results=len(items),
             page=page,
             total_pages=total_pages,
-            data_type=identify_data_type(items),
+            data_type=data_type if items else DataType.EMPTY,
             data_freshness=freshness_label(),
             voice_hint=generate_voice_hint(source, total, len(items)) or None,
             query_context=context,
@@ -69,7 +64,7 @@ def get_crm_data(
 ):
     result = crm.search(search, limit=limit) if search else crm.fetch(limit=limit, page=page, status=status)
     ctx = generate_context_string("CRM", result["total"], len(result["items"]), filters={"status": status, "search": search})
-    return _build_response("CRM", result, page=page, limit=limit, context=ctx)
+    return _build_response("CRM", result, data_type=crm.data_type, page=page, limit=limit, context=ctx)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -87,7 +82,8 @@ def get_support_data(
     result = support.fetch(limit=limit, page=page, priority=priority, status=status, customer_id=customer_id)
     ctx = generate_context_string("Support Tickets", result["total"], len(result["items"]),
                                   filters={"priority": priority, "status": status, "customer_id": customer_id})
-    return _build_response("Support Tickets", result, page=page, limit=limit, context=ctx, post_sort=sort_by_priority)
+    return _build_response("Support Tickets", result, data_type=support.data_type, page=page, limit=limit,
+                           context=ctx, post_sort=sort_by_priority)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -102,7 +98,7 @@ def get_analytics_data(
     page: int = Query(1, ge=1),
 ):
     result = analytics.fetch(limit=limit, page=page, metric=metric, days=days)
-    return _build_response("Analytics", result, page=page, limit=limit,
+    return _build_response("Analytics", result, data_type=analytics.data_type, page=page, limit=limit,
                            context=f"Analytics: {metric or 'all metrics'}, last {days} days")
 
 
@@ -112,20 +108,25 @@ def get_analytics_summary(
     days: int = Query(7, ge=1, le=365),
 ):
     summary_data = analytics.get_summary(metric=metric, days=days)
-    return {
+    # No response model here, so encode directly instead of going through jsonable_encoder.
+    return Response(content=dumps({
         "data": summary_data,
         "metadata": {"data_freshness": freshness_label(), "query_context": f"Summary of {metric or 'all metrics'}, last {days} days"},
         "voice_summary": generate_voice_summary("Analytics", [summary_data], 1),
-    }
+    }), media_type="application/json")
 
 
 # ═══════════════════════════════════════════════════════════════════════
 #  Tool Schema (inlined — no separate llm_service.py needed)
 # ═══════════════════════════════════════════════════════════════════════
 
+# Static payload — encoded once at import, served as raw bytes.
+_TOOL_SCHEMA_BYTES = dumps({
+    "tools": crm.get_tool_definitions() + support.get_tool_definitions() + analytics.get_tool_definitions(),
+    "description": "Available tools for querying business data via OpenAI-compatible function calling.",
+})
+
+
 @router.get("/tools/schema", summary="LLM function calling tool definitions")
-def get_tool_schema():
-    return {
-        "tools": crm.get_tool_definitions() + support.get_tool_definitions() + analytics.get_tool_definitions(),
-        "description": "Available tools for querying business data via OpenAI-compatible function calling.",
-    }
+async def get_tool_schema():
+    return Response(content=_TOOL_SCHEMA_BYTES, media_type="application/json")
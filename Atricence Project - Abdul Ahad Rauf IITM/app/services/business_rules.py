@@ -2,20 +2,29 @@
 Business rules — priority sorting, context strings, freshness labels.
 """
 
-import logging
-from typing import Any, Dict, List, Optional
+import logging, time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
 PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
 
+# (epoch minute, label) — the label only changes once a minute
+_freshness: Tuple[int, str] = (-1, "")
+
 
 def sort_by_priority(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Sort records with a 'priority' field: high > medium > low."""
+    """Sort records with a 'priority' field: high > medium > low (stable, one bucket pass)."""
     if not data or "priority" not in data[0]:
         return data
-    return sorted(data, key=lambda r: PRIORITY_ORDER.get(r.get("priority", ""), 99))
+    buckets = {p: [] for p in PRIORITY_ORDER}
+    unranked: List[Dict[str, Any]] = []
+    for r in data:
+        buckets.get(r.get("priority"), unranked).append(r)
+    ordered = [r for bucket in buckets.values() for r in bucket]
+    ordered.extend(unranked)
+    return ordered
 
 
 def generate_context_string(
@@ -27,11 +36,16 @@ def generate_context_string(
 ) -> str:
     parts = [f"Showing {returned} of {total} {source} records"]
     if filters:
-        active = {k: v for k, v in filters.items() if v is not None}
+        active = [f"{k}={v}" for k, v in filters.items() if v is not None]
         if active:
-            parts.append(f"(filtered by {', '.join(f'{k}={v}' for k, v in active.items())})")
+            parts.append(f"(filtered by {', '.join(active)})")
     return " ".join(parts)
 
 
 def freshness_label() -> str:
-    return f"Data as of {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}"
+    global _freshness
+    minute = int(time.time() // 60)
+    if _freshness[0] != minute:
+        stamp = datetime.fromtimestamp(minute * 60, timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        _freshness = (minute, f"Data as of {stamp}")
+    return _freshness[1]
@@ -0,0 +1,47 @@
+"""
+Numba-compiled numeric kernels. numba is optional: when it is not
+installed every kernel name is None and callers use their NumPy path.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _summarize(values):
+    """Fused single pass: (mean, min, max, first-half mean, second-half mean).
+
+    Two loops split at the midpoint and min/max instead of branches keep the
+    bodies branch-free, so LLVM can vectorize them under fastmath.
+    """
+    n = values.shape[0]
+    mid = n // 2
+    first_sum = 0.0
+    second_sum = 0.0
+    vmin = values[0]
+    vmax = values[0]
+    for i in range(mid):
+        v = values[i]
+        first_sum += v
+        vmin = min(vmin, v)
+        vmax = max(vmax, v)
+    for i in range(mid, n):
+        v = values[i]
+        second_sum += v
+        vmin = min(vmin, v)
+        vmax = max(vmax, v)
+    first_avg = first_sum / mid if mid > 0 else 0.0
+    return (first_sum + second_sum) / n, vmin, vmax, first_avg, second_sum / (n - mid)
+
+
+# Explicit signatures compile at import (and cache=True reuses the machine
+# code across worker restarts); int64 keeps integer metrics' min/max as ints.
+summarize = njit(
+    [
+        "UniTuple(float64, 5)(float64[:])",
+        "Tuple((float64, int64, int64, float64, float64))(int64[:])",
+    ],
+    cache=True,
+    fastmath=True,
+)(_summarize) if njit else None
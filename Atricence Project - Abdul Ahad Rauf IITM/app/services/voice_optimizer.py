@@ -22,8 +22,12 @@ def generate_voice_summary(
 
     # ── Support tickets ─────────────────────────────────────────────
     if source == "Support Tickets":
-        open_count = sum(1 for r in data if r.get("status") == "open")
-        high_count = sum(1 for r in data if r.get("priority") == "high")
+        open_count = high_count = 0
+        for r in data:  # one pass for both counts
+            if r.get("status") == "open":
+                open_count += 1
+            if r.get("priority") == "high":
+                high_count += 1
         parts = [f"I found {total} support tickets"]
         if open_count:
             parts.append(f"{open_count} are currently open")
@@ -33,7 +37,7 @@ def generate_voice_summary(
 
     # ── CRM customers ──────────────────────────────────────────────
     if source == "CRM":
-        active_count = sum(1 for r in data if r.get("status") == "active")
+        active_count = [r.get("status") for r in data].count("active")
         return (
             f"I found {total} customers in the CRM. "
             f"{active_count} are active. "
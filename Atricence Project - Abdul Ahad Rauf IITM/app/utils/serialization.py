@@ -0,0 +1,22 @@
+"""
+JSON helpers — orjson when installed, stdlib json otherwise.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional at runtime
+    orjson = None
+
+
+def loads(raw: bytes):
+    """Parse JSON from bytes."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -0,0 +1,44 @@
+"""
+Per-argument result cache for read-only agent tools.
+"""
+
+import functools, threading
+from collections import OrderedDict
+from time import monotonic
+
+from app.config import settings
+
+_TOOL_CACHE_SIZE = 256  # results kept per tool
+
+
+def memoized(connector):
+    """Reuse a tool's result for repeated arguments.
+
+    Entries expire after settings.TOOL_CACHE_TTL seconds (analytics windows are
+    relative to today) and as soon as the connector's data file changes.
+    """
+    def deco(fn):
+        cache: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            ttl = settings.TOOL_CACHE_TTL
+            if ttl <= 0:
+                return fn(*args, **kwargs)
+            key = (args, tuple(sorted(kwargs.items())))
+            generation, now = connector.generation(), monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit and hit[0] == generation and now - hit[1] < ttl:
+                    cache.move_to_end(key)
+                    return hit[2]
+            result = fn(*args, **kwargs)
+            with lock:
+                cache[key] = (generation, now, result)
+                cache.move_to_end(key)
+                if len(cache) > _TOOL_CACHE_SIZE:
+                    cache.popitem(last=False)
+            return result
+        return wrapper
+    return deco
@@ -3,7 +3,7 @@ Data Connector Agent — LangGraph agent with business data tools.
 All data access is delegated to app/connectors/.
 """
 
-import json, sys
+import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -17,14 +17,15 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from app.connectors.crm_connector import CRMConnector
-from app.connectors.support_connector import SupportConnector
-from app.connectors.analytics_connector import AnalyticsConnector
+from app.connectors import crm, support, analytics
 from app.config import settings
+from app.utils.serialization import dumps
+from app.utils.tool_cache import memoized
 
-crm = CRMConnector()
-support = SupportConnector()
-analytics = AnalyticsConnector()
+
+def _dumps(obj) -> str:
+    """Tool results go back to the LLM as str; orjson-backed when installed."""
+    return dumps(obj).decode()
 
 
 def _int(value: str, default: int) -> int:
@@ -37,27 +38,31 @@ def _int(value: str, default: int) -> int:
 # ── CRM Tools ──────────────────────────────────────────────────────────
 
 @tool
+@memoized(crm)
 def search_customers(query: str, limit: str = "5") -> str:
     """Search CRM customers by name or email."""
     result = crm.search(query, limit=_int(limit, 5))
-    return json.dumps(result)
+    return _dumps(result)
 
 @tool
+@memoized(crm)
 def get_customers(status: str = "", limit: str = "5") -> str:
     """List CRM customers. Filter by status (active/inactive)."""
     result = crm.fetch(limit=_int(limit, 5), status=status or None)
-    return json.dumps(result)
+    return _dumps(result)
 
 @tool
+@memoized(crm)
 def get_customer_by_id(customer_id: str) -> str:
     """Get a specific customer by ID."""
     c = crm.get_by_id(_int(customer_id, 0))
-    return json.dumps(c if c else {"error": f"Customer {customer_id} not found"})
+    return _dumps(c if c else {"error": f"Customer {customer_id} not found"})
 
 
 # ── Support Tools ──────────────────────────────────────────────────────
 
 @tool
+@memoized(support)
 def get_support_tickets(priority: str = "", status: str = "", customer_id: str = "", limit: str = "5") -> str:
     """Retrieve support tickets. Filter by priority, status, customer_id."""
     result = support.fetch(
@@ -66,27 +71,30 @@ def get_support_tickets(priority: str = "", status: str = "", customer_id: str =
         status=status or None,
         customer_id=_int(customer_id, 0) if customer_id else None,
     )
-    return json.dumps(result)
+    return _dumps(result)
 
 @tool
+@memoized(support)
 def get_ticket_by_id(ticket_id: str) -> str:
     """Get a specific support ticket by ID."""
     t = support.get_by_id(_int(ticket_id, 0))
-    return json.dumps(t if t else {"error": f"Ticket {ticket_id} not found"})
+    return _dumps(t if t else {"error": f"Ticket {ticket_id} not found"})
 
 
 # ── Analytics Tools ────────────────────────────────────────────────────
 
 @tool
+@memoized(analytics)
 def get_analytics(metric: str = "", days: str = "7", limit: str = "10") -> str:
     """Retrieve analytics metrics. Filter by metric name and time range (days)."""
     result = analytics.fetch(limit=_int(limit, 10), metric=metric or None, days=_int(days, 7))
-    return json.dumps(result)
+    return _dumps(result)
 
 @tool
+@memoized(analytics)
 def get_analytics_summary(metric: str = "", days: str = "7") -> str:
     """Summarized analytics: average, min, max, trend. Best for voice."""
-    return json.dumps(analytics.get_summary(metric=metric or None, days=_int(days, 7)))
+    return _dumps(analytics.get_summary(metric=metric or None, days=_int(days, 7)))
 
 
 # ── Agent ──────────────────────────────────────────────────────────────
@@ -4,6 +4,8 @@ API endpoint tests using FastAPI TestClient.
 
 import pytest
 from fastapi.testclient import TestClient
+from app.config import settings
+from app.connectors import base
 from app.main import app
 
 
@@ -20,6 +22,20 @@ class TestHealthEndpoint:
         assert "version" in data
 
 
+class TestStartup:
+
+    def test_lifespan_warms_connectors(self):
+        base._CACHE.clear()
+        with TestClient(app):
+            assert {"customers.json", "support_tickets.json", "analytics.json"} <= base._CACHE.keys()
+
+    def test_lifespan_skips_warmup_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", False)
+        base._CACHE.clear()
+        with TestClient(app):
+            assert base._CACHE == {}
+
+
 class TestCRMEndpoint:
 
     def test_get_crm_data(self):
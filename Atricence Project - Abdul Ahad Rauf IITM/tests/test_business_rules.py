@@ -21,6 +21,16 @@ class TestSortByPriority:
         assert sorted_data[1]["priority"] == "medium"
         assert sorted_data[2]["priority"] == "low"
 
+    def test_stable_with_unknown_priority_last(self):
+        data = [
+            {"id": 1, "priority": "low"},
+            {"id": 2, "priority": "urgent"},
+            {"id": 3, "priority": "high"},
+            {"id": 4, "priority": "low"},
+            {"id": 5, "priority": "high"},
+        ]
+        assert [r["id"] for r in sort_by_priority(data)] == [3, 5, 1, 4, 2]
+
     def test_no_priority_field(self):
         data = [{"name": "a"}, {"name": "b"}]
         result = sort_by_priority(data)
@@ -2,10 +2,16 @@
 Tests for data connectors – CRM, Support, and Analytics.
 """
 
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 import pytest
+from app.connectors import base
 from app.connectors.crm_connector import CRMConnector
 from app.connectors.support_connector import SupportConnector
-from app.connectors.analytics_connector import AnalyticsConnector
+from app.connectors.analytics_connector import AnalyticsConnector, _cutoff_key, _summarize
 
 
 class TestCRMConnector:
@@ -20,6 +26,26 @@ class TestCRMConnector:
         assert len(result["items"]) <= 5
         assert result["total"] > 0
 
+    def test_generation_changes_with_data_file(self, tmp_path, monkeypatch):
+        (tmp_path / "data").mkdir()
+        data_file = tmp_path / "data" / "customers.json"
+        data_file.write_bytes((base.PROJECT_ROOT / "data" / "customers.json").read_bytes())
+        monkeypatch.setattr(base, "PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr(base, "_CACHE", {})
+        before = self.connector.generation()
+        assert self.connector.generation() == before
+        data_file.write_bytes(data_file.read_bytes() + b"\n")
+        assert self.connector.generation() != before
+
+    def test_index_field_values_interned(self):
+        statuses = {id(r["status"]) for r in self.connector._cache()["data"] if r["status"] == "active"}
+        assert len(statuses) == 1
+
+    def test_unfiltered_fetch_is_stored_order(self):
+        result = self.connector.fetch(limit=3, page=2, status=None)
+        assert result["items"] == self.connector._load()[3:6]
+        assert result["total"] == len(self.connector._load())
+
     def test_fetch_pagination(self):
         page1 = self.connector.fetch(limit=3, page=1)
         page2 = self.connector.fetch(limit=3, page=2)
@@ -36,6 +62,22 @@ class TestCRMConnector:
         for item in result["items"]:
             assert "customer 1" in item["name"].lower() or "customer 1" in item["email"].lower()
 
+    def test_repeated_search_is_cached(self, monkeypatch):
+        first = self.connector.search("USER1", limit=3)
+        entry = self.connector._cache()
+        assert "user1" in entry["searches"]
+        monkeypatch.setitem(entry, "search_blobs", [])  # a cache hit never rescans
+        again = self.connector.search("user1", limit=50)
+        assert first["total"] == again["total"] > 0
+        assert again["items"][:3] == first["items"]
+
+    def test_search_cache_evicts_oldest(self, monkeypatch):
+        monkeypatch.setattr(base, "_SEARCH_CACHE_SIZE", 2)
+        monkeypatch.setitem(self.connector._cache(), "searches", OrderedDict())
+        for q in ("user1", "user2", "user3"):
+            self.connector.search(q)
+        assert list(self.connector._cache()["searches"]) == ["user2", "user3"]
+
     def test_get_by_id(self):
         customer = self.connector.get_by_id(1)
         assert customer is not None
@@ -45,6 +87,49 @@ class TestCRMConnector:
         customer = self.connector.get_by_id(99999)
         assert customer is None
 
+    def test_by_id_keeps_first_duplicate(self):
+        rows = [
+            {"customer_id": 7, "name": "first", "created_at": "2024-01-02"},
+            {"customer_id": 7, "name": "second", "created_at": "2024-01-01"},
+            {"name": "no id", "created_at": "2024-01-03"},
+        ]
+        by_id = self.connector._build_cache(rows)["by_id"]
+        assert by_id[7]["name"] == "first"
+
+    def test_load_is_cached(self):
+        assert self.connector._load() is CRMConnector()._load()
+
+    def test_sorted_fetch_does_not_mutate_cache(self):
+        before = list(self.connector._load())
+        self.connector.fetch(limit=5, sort_by="name", sort_order="asc")
+        assert self.connector._load() == before
+
+    def test_sorted_fetch_pages_a_sorted_view(self):
+        expected = sorted(
+            (r for r in self.connector._load() if r["status"] == "active"),
+            key=lambda r: r["created_at"], reverse=True,
+        )
+        for page in (1, 2):
+            result = self.connector.fetch(limit=4, page=page, sort_by="created_at", status="active")
+            assert result["items"] == expected[(page - 1) * 4 : page * 4]
+            assert result["total"] == len(expected)
+
+    def test_filtered_view_derived_from_unfiltered_view(self):
+        self.connector.fetch(limit=1, sort_by="created_at")  # caches the unfiltered view
+        expected = sorted(
+            (r for r in self.connector._load() if r["status"] == "inactive"),
+            key=lambda r: r["created_at"], reverse=True,
+        )
+        result = self.connector.fetch(limit=3, page=2, sort_by="created_at", status="inactive")
+        assert result["items"] == expected[3:6]
+        assert result["total"] == len(expected)
+
+    def test_repeated_filtered_sorted_fetch_uses_view(self, monkeypatch):
+        first = self.connector.fetch(limit=3, page=2, sort_by="created_at", status="active")
+        assert ("created_at", "desc", frozenset({("status", "active")})) in self.connector._cache()["views"]
+        monkeypatch.setattr(self.connector, "_rows", None)  # a view hit never recomputes rows
+        assert self.connector.fetch(limit=3, page=2, sort_by="created_at", status="active") == first
+
     def test_tool_definitions(self):
         tools = self.connector.get_tool_definitions()
         assert len(tools) >= 2
@@ -74,17 +159,31 @@ class TestSupportConnector:
         for item in result["items"]:
             assert item["status"] == "open"
 
+    def test_combined_filters_match_scan(self):
+        result = self.connector.fetch(limit=999, priority="high", status="open")
+        expected = [r for r in self.connector._load() if r["priority"] == "high" and r["status"] == "open"]
+        assert result["items"] == expected
+        assert result["total"] == len(expected)
+
     def test_get_by_id(self):
         ticket = self.connector.get_by_id(1)
         assert ticket is not None
         assert ticket["ticket_id"] == 1
 
+    def test_get_by_id_not_found(self):
+        assert self.connector.get_by_id(99999) is None
+
 
 class TestAnalyticsConnector:
 
     def setup_method(self):
         self.connector = AnalyticsConnector()
 
+    def test_unknown_metric_returns_empty_list(self):
+        result = self.connector.fetch(metric="nope", days=3650)
+        assert result["items"] == [] and isinstance(result["items"], list)
+        assert result["total"] == 0
+
     def test_fetch_returns_items(self):
         result = self.connector.fetch(limit=5)
         assert "items" in result
@@ -95,6 +194,12 @@ class TestAnalyticsConnector:
         for item in result["items"]:
             assert item["metric"] == "daily_active_users"
 
+    def test_days_filter_newest_first(self):
+        result = self.connector.fetch(limit=999, metric="daily_active_users", days=3650)
+        dates = [r["date"] for r in result["items"]]
+        assert dates == sorted(dates, reverse=True)
+        assert result["total"] == len([r for r in self.connector._load() if r["metric"] == "daily_active_users"])
+
     def test_get_summary(self):
         summary = self.connector.get_summary(metric="daily_active_users", days=30)
         assert "average" in summary
@@ -102,6 +207,33 @@ class TestAnalyticsConnector:
         assert "min" in summary
         assert "max" in summary
 
+    def test_cutoff_key_matches_calendar(self):
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=30)).date()
+        assert _cutoff_key(30, int(time.time()) // 86400) == int(cutoff.strftime("%Y%m%d"))
+
+    def test_summary_cached_per_window(self):
+        first = self.connector.get_summary(days=3650)
+        assert self.connector.get_summary(days=3650) == first
+        assert (None, first["data_points"]) in self.connector._cache()["summaries"]
+
+    def test_sorted_filtered_fetch_pages(self):
+        window = self.connector.fetch(limit=999, days=3650)["items"]
+        expected = sorted(window, key=lambda r: r["value"], reverse=True)
+        result = self.connector.fetch(limit=4, page=2, days=3650, sort_by="value")
+        assert result["items"] == expected[4:8]
+        assert result["total"] == len(window)
+
+    def test_summarize_single_pass(self):
+        assert _summarize(np.array([4, 8, 1, 7, 5])) == (5.0, 1, 8, 6.0, 13 / 3)
+
+    def test_summarize_large_input_matches_loop(self):
+        values = [(i * 37) % 101 for i in range(200)]
+        average, vmin, vmax, first_avg, second_avg = _summarize(np.array(values))
+        assert average == pytest.approx(sum(values) / 200)
+        assert (vmin, vmax) == (min(values), max(values))
+        assert first_avg == pytest.approx(sum(values[:100]) / 100)
+        assert second_avg == pytest.approx(sum(values[100:]) / 100)
+
     def test_tool_definitions(self):
         tools = self.connector.get_tool_definitions()
         assert len(tools) >= 2
@@ -0,0 +1,68 @@
+"""
+Tests for the agent tool result cache.
+"""
+
+import pytest
+from app.config import settings
+from app.utils import tool_cache
+
+
+class _FakeConnector:
+
+    def __init__(self):
+        self.stamp = (1, 100)
+
+    def generation(self):
+        return self.stamp
+
+
+class TestMemoized:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch):
+        self.now = 1000.0
+        monkeypatch.setattr(tool_cache, "monotonic", lambda: self.now)
+        monkeypatch.setattr(settings, "TOOL_CACHE_TTL", 30.0)
+        self.connector = _FakeConnector()
+        self.calls = []
+
+        @tool_cache.memoized(self.connector)
+        def lookup(query: str = "") -> str:
+            self.calls.append(query)
+            return f"result for {query}"
+
+        self.lookup = lookup
+
+    def test_repeat_call_is_cached(self):
+        assert self.lookup(query="a") == self.lookup(query="a") == "result for a"
+        assert self.calls == ["a"]
+
+    def test_entry_expires_after_ttl(self):
+        self.lookup(query="a")
+        self.now += 29.9
+        self.lookup(query="a")
+        self.now += 0.2
+        self.lookup(query="a")
+        assert self.calls == ["a", "a"]
+
+    def test_data_file_change_invalidates(self):
+        self.lookup(query="a")
+        self.connector.stamp = (2, 100)
+        self.lookup(query="a")
+        assert self.calls == ["a", "a"]
+
+    def test_oldest_entry_evicted(self, monkeypatch):
+        monkeypatch.setattr(tool_cache, "_TOOL_CACHE_SIZE", 2)
+        self.lookup(query="a")
+        self.lookup(query="b")
+        self.lookup(query="a")  # refreshes "a", leaving "b" the oldest
+        self.lookup(query="c")
+        self.lookup(query="a")
+        self.lookup(query="b")
+        assert self.calls == ["a", "b", "c", "b"]
+
+    def test_zero_ttl_bypasses_cache(self, monkeypatch):
+        monkeypatch.setattr(settings, "TOOL_CACHE_TTL", 0)
+        self.lookup(query="a")
+        self.lookup(query="a")
+        assert self.calls == ["a", "a"]